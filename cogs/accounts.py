@@ -1,7 +1,8 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from utils.database import fetch_all_games, get_guild_accounts
+from itertools import islice
+from utils.database import fetch_all_games, get_guild_accounts, get_guild_accounts_by_game
 from database.operations import db_ops
 import logging
 
@@ -65,24 +66,23 @@ class Accounts(commands.Cog):
 
             game_icon = GAME_ICONS.get(game.lower(), "https://via.placeholder.com/150")
 
+            # One description block instead of a field per account: smaller
+            # embed payload and no per-account field dicts
+            lines = [
+                f"`{idx:>2}.` **{getattr(account, 'name', 'Unknown')}** — "
+                f"{'✅ Active' if getattr(account, 'is_active', True) else '❌ Inactive'}"
+                for idx, account in enumerate(accounts, start=1)
+            ]
+
             embed = discord.Embed(
                 title=f"🎮 {game.title()} Accounts",
-                description=f"Accounts registered in **{interaction.guild.name}**",
+                description=(
+                    f"Accounts registered in **{interaction.guild.name}**\n\n"
+                    + "\n".join(lines)
+                ),
                 color=0x3498db
             )
             embed.set_thumbnail(url=game_icon)
-
-            for idx, account in enumerate(accounts, start=1):
-                account_name = getattr(account, 'name', 'Unknown')
-                is_active = getattr(account, 'is_active', True)
-                status = "✅ Active" if is_active else "❌ Inactive"
-                
-                embed.add_field(
-                    name=f"{idx}. {account_name}",
-                    value=f"**Status:** {status}",
-                    inline=False
-                )
-
             embed.set_footer(text=f"Total: {len(accounts)} accounts")
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -104,13 +104,8 @@ class Accounts(commands.Cog):
                 )
                 return
 
-            user_accounts = {}
-            games = await fetch_all_games()
-
-            for game in games:
-                accounts = await get_guild_accounts(interaction.guild.id, game)
-                if accounts:
-                    user_accounts[game] = accounts
+            # One query for all games at once instead of one per game
+            user_accounts = await get_guild_accounts_by_game(interaction.guild.id)
 
             if not user_accounts:
                 embed = discord.Embed(
@@ -136,7 +131,8 @@ class Accounts(commands.Cog):
             for game, accounts in user_accounts.items():
                 account_count = len(accounts)
                 total_accounts += account_count
-                account_names = [getattr(acc, 'name', 'Unknown') for acc in accounts[:5]]
+                # islice avoids copying the list just to preview 5 names
+                account_names = [getattr(acc, 'name', 'Unknown') for acc in islice(accounts, 5)]
                 account_list = ", ".join(account_names)
                 if account_count > 5:
                     account_list += f" ... +{account_count - 5} more"
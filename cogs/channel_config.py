@@ -46,6 +46,11 @@ class ChannelConfig(commands.Cog):
                 value=str(channel.id)
             )
 
+            # Drop the cached channel so notifications pick up the new one
+            if message_type == "checkin":
+                from games.game import invalidate_channel_cache
+                invalidate_channel_cache(interaction.guild.id)
+
             # Create success embed
             embed = discord.Embed(
                 title="✅ Channel Configured Successfully!",
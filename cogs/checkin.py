@@ -4,7 +4,7 @@ from discord import app_commands
 import asyncio
 import logging
 from utils.database import fetch_cookies_from_database
-from games.game import GameManager
+from games.game import get_game_manager
 from database.operations import db_ops
 
 logger = logging.getLogger(__name__)
@@ -35,8 +35,8 @@ class CheckIn(commands.Cog):
                 await interaction.followup.send("❌ No accounts configured for this server. Use `/add_cookie` to add an account.", ephemeral=True)
                 return
 
-            # Initialize game manager
-            game_manager = GameManager()
+            # Shared game manager
+            game_manager = get_game_manager()
             total_successes = 0
 
             # Process each game for this guild
@@ -162,13 +162,12 @@ class DatabaseOperations:
             }
         }
 
-        # Load api_type from constants.json if available
+        # Load api_type from constants.json if available (cached by mtime)
         try:
-            import json
             import os
+            from games.game import load_constants
             constants_path = os.getenv("CONSTANTS_PATH", "/app/constants.json")
-            with open(constants_path, "r") as f:
-                constants = json.load(f)
+            constants = load_constants(constants_path)
             if game_name in constants and "api_type" in constants[game_name]:
                 config["api_type"] = constants[game_name]["api_type"]
         except Exception:
@@ -241,6 +240,33 @@ class DatabaseOperations:
             result = await session.execute(stmt)
             return result.scalars().all()
 
+    async def get_all_accounts_by_game(self, guild_id: int) -> Dict[str, List[Account]]:
+        """Get all active accounts in a guild grouped by game name (one query)"""
+        async with db_manager.get_session() as session:
+            stmt = (
+                select(Account)
+                .options(joinedload(Account.user), joinedload(Account.game))
+                .where(
+                    and_(
+                        Account.guild_id == guild_id,
+                        Account.is_active == True
+                    )
+                )
+                .order_by(Account.game_id, Account.name)
+            )
+            result = await session.execute(stmt)
+            accounts = result.scalars().all()
+
+            # Group by game name
+            grouped = {}
+            for account in accounts:
+                game_name = account.game.name
+                if game_name not in grouped:
+                    grouped[game_name] = []
+                grouped[game_name].append(account)
+
+            return grouped
+
     async def get_all_accounts_for_checkin(self) -> Dict[str, List[Account]]:
         """Get all active accounts grouped by game for check-in process"""
         async with db_manager.get_session() as session:
@@ -372,6 +398,22 @@ class DatabaseOperations:
 
             await session.commit()
 
+    async def get_checked_in_account_ids(self, account_ids: List[int]) -> set:
+        """Get the subset of account_ids with a successful check-in logged today"""
+        if not account_ids:
+            return set()
+
+        async with db_manager.get_session() as session:
+            stmt = select(CheckinLog.account_id).where(
+                and_(
+                    CheckinLog.account_id.in_(account_ids),
+                    CheckinLog.checkin_date == date.today(),
+                    CheckinLog.success == True
+                )
+            )
+            result = await session.execute(stmt)
+            return set(result.scalars().all())
+
     async def get_checkin_stats(self, guild_id: int, days: int = 30) -> Dict[str, Any]:
         """Get check-in statistics for guild"""
         session = db_manager.get_session()
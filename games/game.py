@@ -1,264 +1,598 @@
-import logging
-import json
-import os
-from typing import List, Dict, Any, Optional
-from dotenv import load_dotenv
-import discord
-
-from games.endfield_adapter import EndfieldAdapter
-
-load_dotenv()
-constants_path = os.getenv("CONSTANTS_PATH", "/app/constants.json")
-
-def load_constants(file_path):
-    if not os.path.isfile(file_path):
-        raise FileNotFoundError(f"Constants file not found at: {file_path}")
-    with open(file_path, "r") as file:
-        return json.load(file)
-
-constants = load_constants(constants_path)
-print(f"Using constants file at: {constants_path}")
-
-logger = logging.getLogger(__name__)
-
-class Game:
-    """
-    Game class for Arknights: Endfield using SKPort API
-    This is simplified compared to miHoYo_bot since we only support Endfield
-    """
-
-    def __init__(self, name, config, cookies):
-        self.name = name  # "endfield"
-        self.full_name = config["game"]  # "Arknights: Endfield"
-        self.config = config
-        self.data = cookies  # List of {name, cookie} dicts
-
-    def sign(self, account_token, account_name="Unknown"):
-        """
-        Perform check-in using SKPort API
-
-        Args:
-            account_token: JWT token or cred value
-            account_name: Name of the account for logging
-
-        Returns:
-            dict: {"success": bool, "message": str, ...}
-        """
-        try:
-            logger.info(f"Processing Endfield account: {account_name} using SKPort API")
-
-            # Create adapter instance
-            adapter = EndfieldAdapter(account_token, account_name)
-
-            # Perform check-in
-            result = adapter.perform_checkin()
-
-            return {
-                "success": result["success"],
-                "message": result["message"],
-                "already_signed": result.get("already_signed", False),
-                "reward": result.get("reward"),
-                "total_sign_day": result.get("total_sign_day", 0)
-            }
-
-        except Exception as e:
-            logger.error(f"Endfield check-in error: {e}")
-            return {
-                "success": False,
-                "message": str(e),
-                "already_signed": False,
-                "reward": None,
-                "total_sign_day": 0
-            }
-
-    async def process_all_accounts(self) -> List[Dict[str, Any]]:
-        """
-        Process all accounts for this game
-
-        Returns:
-            List of result dicts for each account
-        """
-        results = []
-
-        for account_data in self.data:
-            account_name = account_data['name']
-            account_token = account_data['cookie']  # Actually the token for Endfield
-
-            logger.info(f"Processing account: {account_name} for {self.full_name}")
-
-            # Perform check-in
-            sign_result = self.sign(account_token, account_name)
-
-            # Build result
-            result = {
-                "account_name": account_name,
-                "game": self.full_name,
-                "success": sign_result["success"],
-                "message": sign_result["message"],
-                "already_signed": sign_result.get("already_signed", False),
-                "reward": sign_result.get("reward"),
-                "all_rewards": sign_result.get("all_rewards", []),
-                "total_sign_day": sign_result.get("total_sign_day", 0),
-                "uid": None,  # SKPort doesn't easily expose UID in check-in flow
-                "nickname": None,
-                "rank": None,
-                "region": None
-            }
-
-            results.append(result)
-
-        return results
-
-    async def send_discord_notification_direct(self, guild_id, success_data):
-        """
-        Send Discord notification to configured channel
-
-        Args:
-            guild_id: Discord guild ID
-            success_data: Dict with check-in results
-        """
-        try:
-            # Import here to avoid circular imports
-            from database.operations import db_ops
-            from utils.discord import get_bot_instance
-
-            # Get channel ID from database
-            channel_id_str = await db_ops.get_guild_setting(guild_id, "channel_checkin")
-            if not channel_id_str:
-                logger.warning(f"No check-in channel configured for guild {guild_id}")
-                return
-
-            channel_id = int(channel_id_str)
-
-            # Get bot instance
-            bot = get_bot_instance()
-            if not bot:
-                logger.error("Bot instance not available")
-                return
-
-            channel = bot.get_channel(channel_id)
-            if not channel:
-                logger.error(f"Channel {channel_id} not found")
-                return
-
-            # Build embed
-            embed = self._build_notification_embed(success_data)
-
-            # Send message
-            await channel.send(embed=embed)
-            logger.info(f"Sent Endfield notification to channel {channel_id}")
-
-        except Exception as e:
-            logger.error(f"Error sending Discord notification: {e}")
-
-    def _build_notification_embed(self, data: Dict[str, Any]) -> discord.Embed:
-        """Build Discord embed for check-in notification"""
-
-        # Get assets from config
-        assets = self.config.get("assets", {})
-        author_name = assets.get("author", "Endministrator")
-        game_name = assets.get("game", "Arknights: Endfield")
-        icon_url = assets.get("icon", "")
-
-        # Determine color based on success
-        color = discord.Color.green() if data["success"] else discord.Color.red()
-
-        # Create embed
-        embed = discord.Embed(
-            title=f"📋 Daily Check-in Report",
-            description=data["message"],
-            color=color
-        )
-
-        # Set author
-        account_name = data.get("account_name", "Doctor")
-        embed.set_author(
-            name=f"{author_name} • {account_name}",
-            icon_url=icon_url
-        )
-
-        # Add fields
-        if data["success"] or data.get("already_signed"):
-            # Show total sign days
-            total_days = data.get("total_sign_day", 0)
-            embed.add_field(
-                name="📅 Total Sign-ins",
-                value=f"{total_days} days",
-                inline=True
-            )
-
-            # Show reward if available
-            reward = data.get("reward")
-            reward_icon = None
-            if reward:
-                reward_text = f"{reward.get('name', 'Unknown')} x{reward.get('count', 0)}"
-                reward_icon = reward.get('icon', '')
-                embed.add_field(
-                    name="🎁 Reward",
-                    value=reward_text,
-                    inline=True
-                )
-
-            # Show additional rewards if available
-            all_rewards = data.get("all_rewards", [])
-            if all_rewards and len(all_rewards) > 1:
-                bonus_rewards = [f"{r.get('name', 'Unknown')} x{r.get('count', 0)}"
-                                for r in all_rewards[1:]]  # Skip first (main reward)
-                if bonus_rewards:
-                    embed.add_field(
-                        name="🌟 Bonus Rewards",
-                        value="\n".join(bonus_rewards),
-                        inline=False
-                    )
-
-        # Add footer
-        embed.set_footer(text=game_name)
-
-        # Set reward icon on the right side (thumbnail) if available
-        if reward and reward_icon:
-            embed.set_thumbnail(url=reward_icon)
-        # If no reward icon, use game icon as thumbnail
-        elif icon_url:
-            embed.set_thumbnail(url=icon_url)
-
-        return embed
-
-
-class GameManager:
-    """Manages check-in processing for all games"""
-
-    def __init__(self):
-        self.constants = constants
-
-    async def process_game_checkins(self, guild_id, game_name, game_config, accounts):
-        """
-        Process check-ins for a specific game
-
-        Args:
-            guild_id: Discord guild ID
-            game_name: Name of the game (e.g., "endfield")
-            game_config: Game configuration dict
-            accounts: List of account dicts with 'name' and 'cookie'
-
-        Returns:
-            List of successful check-in results
-        """
-        logger.info(f"Processing {len(accounts)} accounts for {game_config['game']}")
-
-        # Create game instance
-        game = Game(game_name, game_config, accounts)
-
-        # Process all accounts
-        results = await game.process_all_accounts()
-
-        # Send Discord notifications only for NEW check-ins (not already signed)
-        success_results = [r for r in results if r["success"] and not r.get("already_signed")]
-
-        if success_results:
-            # Send notification for each newly checked-in account
-            for result in success_results:
-                await game.send_discord_notification_direct(guild_id, result)
-
-        # Return all successful results (including already signed)
-        all_success = [r for r in results if r["success"] or r.get("already_signed")]
-        return all_success
+import asyncio
+import functools
+import hashlib
+import logging
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional
+from dotenv import load_dotenv
+import discord
+
+from games.endfield_adapter import EndfieldAdapter
+
+# Same optional-orjson pattern as the adapter: C-level parse, no Python
+# text decoding, stdlib fallback for minimal environments
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+constants_path = os.getenv("CONSTANTS_PATH", "/app/constants.json")
+
+# Keys every game config (and its assets block) must provide. Validated
+# once at load so consumers can index directly instead of defensive
+# .get()-chains on every call.
+_REQUIRED_GAME_KEYS = ("game", "assets")
+_REQUIRED_ASSET_KEYS = ("author", "game", "icon")
+
+def _validate_constants(data):
+    """Validate the constants shape; a malformed file fails fast at startup
+    with a message naming the offending entry"""
+    if not isinstance(data, dict) or not data:
+        raise ValueError("Constants file must be a non-empty object of game configs")
+    for game_name, config in data.items():
+        if not isinstance(config, dict):
+            raise ValueError(f"Constants entry '{game_name}' must be an object")
+        for key in _REQUIRED_GAME_KEYS:
+            if key not in config:
+                raise ValueError(f"Constants entry '{game_name}' is missing '{key}'")
+        assets = config["assets"]
+        if not isinstance(assets, dict):
+            raise ValueError(f"Constants entry '{game_name}' has a non-object 'assets'")
+        for key in _REQUIRED_ASSET_KEYS:
+            if not isinstance(assets.get(key), str):
+                raise ValueError(
+                    f"Constants entry '{game_name}' assets must include string '{key}'"
+                )
+    return data
+
+@functools.lru_cache(maxsize=4)
+def _parse_constants(file_path, mtime):
+    """Parse and validate the constants file; memoized per (path, mtime) so
+    the JSON is only re-read when the file actually changes"""
+    with open(file_path, "rb") as file:
+        return _validate_constants(_json_loads(file.read()))
+
+def load_constants(file_path):
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"Constants file not found at: {file_path}")
+    return _parse_constants(file_path, os.path.getmtime(file_path))
+
+# Read-only view so every consumer shares one parsed copy safely
+constants = MappingProxyType(load_constants(constants_path))
+logger.info("Using constants file at: %s", constants_path)
+
+# How many accounts may check in at the same time
+CHECKIN_CONCURRENCY = 10
+
+# Resolved notification channels cached per guild: K successful accounts
+# in one run would otherwise repeat the same guild-setting query and
+# bot.get_channel lookup K times.
+_CHANNEL_CACHE_TTL = 300  # seconds
+_CHANNEL_NEGATIVE_TTL = 60  # seconds; "not configured" is cached too, but shorter
+_channel_cache = {}  # guild_id -> (monotonic timestamp, channel or None)
+
+# Lazily resolved module references: these imports must stay out of module
+# scope (circular imports), but resolving them per call re-hits sys.modules
+# and attribute lookups on every notification.
+_db_ops = None
+_get_bot_instance = None
+
+def _resolve_db_ops():
+    global _db_ops
+    if _db_ops is None:
+        from database.operations import db_ops
+        _db_ops = db_ops
+    return _db_ops
+
+def _resolve_get_bot_instance():
+    global _get_bot_instance
+    if _get_bot_instance is None:
+        from utils.discord import get_bot_instance
+        _get_bot_instance = get_bot_instance
+    return _get_bot_instance
+
+def invalidate_channel_cache(guild_id):
+    """Drop the cached channel for a guild (call when /set_channel changes it)"""
+    _channel_cache.pop(guild_id, None)
+
+async def resolve_checkin_channel(guild_id):
+    """Resolve the configured check-in channel for a guild, with caching"""
+    entry = _channel_cache.get(guild_id)
+    if entry:
+        ttl = _CHANNEL_CACHE_TTL if entry[1] is not None else _CHANNEL_NEGATIVE_TTL
+        if time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+    db_ops = _resolve_db_ops()
+
+    channel_id_str = await db_ops.get_guild_setting(guild_id, "channel_checkin")
+    if not channel_id_str:
+        logger.warning("No check-in channel configured for guild %s", guild_id)
+        # Negative cache: unconfigured guilds shouldn't re-query the DB for
+        # every notification. /set_channel invalidates, so a new config is
+        # picked up immediately (the short TTL only covers direct DB edits).
+        _channel_cache[guild_id] = (time.monotonic(), None)
+        return None
+
+    bot = _resolve_get_bot_instance()()
+    if not bot:
+        logger.error("Bot instance not available")
+        return None
+
+    channel = bot.get_channel(int(channel_id_str))
+    if not channel:
+        logger.error("Channel %s not found", channel_id_str)
+        return None
+
+    _channel_cache[guild_id] = (time.monotonic(), channel)
+    return channel
+
+class _ChannelRateLimiter:
+    """
+    Minimal asyncio sliding-window rate limiter: at most `rate` sends per
+    `period` seconds. Defaults match Discord's per-channel message limit
+    (5 messages / 5s), so concurrent check-in runs never burst past it
+    and trip 429 retries inside discord.py.
+    """
+
+    def __init__(self, rate=5, period=5.0):
+        self.rate = rate
+        self.period = period
+        self._sends = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._sends and now - self._sends[0] >= self.period:
+                    self._sends.popleft()
+                if len(self._sends) < self.rate:
+                    self._sends.append(now)
+                    return
+                await asyncio.sleep(self.period - (now - self._sends[0]))
+
+# One limiter per channel, shared by every send path in the process
+_channel_limiters = {}  # channel_id -> _ChannelRateLimiter
+
+def _channel_limiter(channel_id) -> _ChannelRateLimiter:
+    limiter = _channel_limiters.get(channel_id)
+    if limiter is None:
+        limiter = _channel_limiters[channel_id] = _ChannelRateLimiter()
+    return limiter
+
+# Successful check-in results memoized per account per UTC day.
+# Once an account has claimed (or was already signed in), re-running the
+# check-in that day would just repeat 4 HTTP round-trips for the same answer.
+_checkin_result_cache = {}  # (token digest, utc date) -> result dict
+
+# Adapters kept alive across invocations so their auth state (cred,
+# sign_token, game_role) stays hot between check-ins. Keyed by token
+# digest: a rotated token simply gets a fresh adapter.
+_adapters = {}  # token digest -> EndfieldAdapter
+
+def _token_digest(account_token):
+    """Hash an account token for use as a cache key (never stored raw)"""
+    return hashlib.sha256(account_token.encode()).hexdigest()
+
+def _get_adapter(account_token, account_name):
+    """Get (or create) the long-lived adapter for this account"""
+    digest = _token_digest(account_token)
+    adapter = _adapters.get(digest)
+    if adapter is None:
+        adapter = _adapters[digest] = EndfieldAdapter(account_token, account_name)
+    return adapter
+
+def _checkin_cache_key(account_token):
+    """Cache key for today's check-in result (token hashed, never stored raw)"""
+    return (_token_digest(account_token), datetime.now(timezone.utc).date())
+
+def _prune_checkin_cache():
+    """Drop entries from previous UTC days"""
+    today = datetime.now(timezone.utc).date()
+    stale = [key for key in _checkin_result_cache if key[1] != today]
+    for key in stale:
+        del _checkin_result_cache[key]
+
+class Game:
+    """
+    Game class for Arknights: Endfield using SKPort API
+    This is simplified compared to miHoYo_bot since we only support Endfield
+    """
+
+    def __init__(self, name, config, cookies):
+        self.name = name  # "endfield"
+        self.full_name = config["game"]  # "Arknights: Endfield"
+        self.config = config
+        self.data = cookies  # List of {name, cookie} dicts
+
+        # Static embed scaffolding, built once as plain payload pieces and
+        # shared by every notification dict instead of rebuilt per embed.
+        # Direct indexing is safe: the constants shape is validated at load.
+        assets = config["assets"]
+        self._author_name = assets["author"]
+        self._game_name = assets["game"]
+        self._icon_url = assets["icon"]
+        self._color_success = discord.Color.green().value
+        self._color_failure = discord.Color.red().value
+        self._embed_footer = {"text": self._game_name}
+        self._embed_thumbnail = {"url": self._icon_url} if self._icon_url else None
+
+    async def sign(self, account_token, account_name="Unknown"):
+        """
+        Perform check-in using SKPort API
+
+        Args:
+            account_token: JWT token or cred value
+            account_name: Name of the account for logging
+
+        Returns:
+            dict: full result row (see _result_row)
+        """
+        logger.info("Processing Endfield account: %s using SKPort API", account_name)
+
+        # Return today's memoized result if this account already checked in
+        cache_key = _checkin_cache_key(account_token)
+        cached = _checkin_result_cache.get(cache_key)
+        if cached:
+            logger.info("Check-in for %s already done today, using cached result", account_name)
+            return dict(cached)
+
+        # Reuse the long-lived adapter for this account
+        adapter = _get_adapter(account_token, account_name)
+
+        # Perform check-in (async so multiple accounts can overlap I/O).
+        # Unexpected exceptions propagate to _process_one, which turns
+        # them into failure results.
+        result = await adapter.perform_checkin()
+
+        # Build the final result row directly - no intermediate dict that
+        # _process_one would only copy key-by-key into another one
+        sign_result = self._result_row(
+            account_name,
+            success=result["success"],
+            message=result["message"],
+            already_signed=result.get("already_signed", False),
+            reward=result.get("reward"),
+            all_rewards=result.get("all_rewards", []),
+            total_sign_day=result.get("total_sign_day", 0)
+        )
+
+        # Only memoize successful outcomes; failures should retry
+        if sign_result["success"]:
+            _prune_checkin_cache()
+            _checkin_result_cache[cache_key] = dict(sign_result)
+
+        return sign_result
+
+    def _result_row(self, account_name, success, message, already_signed=False,
+                    reward=None, all_rewards=None, total_sign_day=0) -> Dict[str, Any]:
+        """Build the per-account result dict consumed by notifications"""
+        return {
+            "account_name": account_name,
+            "game": self.full_name,
+            "success": success,
+            "message": message,
+            "already_signed": already_signed,
+            "reward": reward,
+            "all_rewards": all_rewards or [],
+            "total_sign_day": total_sign_day,
+            "uid": None,  # SKPort doesn't easily expose UID in check-in flow
+            "nickname": None,
+            "rank": None,
+            "region": None
+        }
+
+    async def _process_one(self, account_data, semaphore, signed_ids=frozenset()) -> Dict[str, Any]:
+        """Check in a single account and build its result dict"""
+        account_name = account_data['name']
+        account_token = account_data['cookie']  # Actually the token for Endfield
+        account_id = account_data.get('id')
+
+        if account_id in signed_ids:
+            # A successful check-in is already logged for today (possibly by
+            # an earlier cron run) - no HTTP needed
+            logger.info("Account %s already checked in today (logged), skipping", account_name)
+            sign_result = self._result_row(
+                account_name,
+                success=True,
+                message="Already signed in today",
+                already_signed=True
+            )
+        else:
+            try:
+                async with semaphore:
+                    logger.info("Processing account: %s for %s", account_name, self.full_name)
+
+                    # Perform check-in
+                    sign_result = await self.sign(account_token, account_name)
+            except Exception as e:
+                logger.error("Check-in task failed for %s: %s", account_name, e)
+                sign_result = self._result_row(account_name, success=False, message=str(e))
+
+            # Log the outcome so later runs (and restarts) can skip this account
+            if account_id and sign_result["success"]:
+                try:
+                    db_ops = _resolve_db_ops()
+                    reward = sign_result.get("reward") or {}
+                    await db_ops.log_checkin(
+                        account_id,
+                        True,
+                        reward_name=reward.get("name"),
+                        reward_count=reward.get("count"),
+                        reward_icon=reward.get("icon"),
+                        total_checkins=sign_result.get("total_sign_day", 0)
+                    )
+                except Exception as e:
+                    logger.error("Failed to log check-in for %s: %s", account_name, e)
+
+        # sign() already returns the final row - nothing to rebuild
+        return sign_result
+
+    async def stream_all_accounts(self):
+        """
+        Process all accounts concurrently, yielding each result as it completes
+
+        Check-ins are independent I/O-bound work, so they run in parallel
+        (bounded by CHECKIN_CONCURRENCY). Yielding in completion order lets
+        the caller start sending notifications while the slowest accounts
+        are still signing in, instead of waiting for the whole batch.
+        """
+        # One query up front: which of these accounts already logged a
+        # successful check-in today (survives restarts, unlike the caches)
+        signed_ids = frozenset()
+        account_ids = [a.get('id') for a in self.data if a.get('id')]
+        if account_ids:
+            try:
+                db_ops = _resolve_db_ops()
+                signed_ids = frozenset(await db_ops.get_checked_in_account_ids(account_ids))
+            except Exception as e:
+                logger.error("Failed to load today's check-in log: %s", e)
+
+        semaphore = asyncio.Semaphore(CHECKIN_CONCURRENCY)
+        tasks = [
+            asyncio.create_task(self._process_one(account_data, semaphore, signed_ids))
+            for account_data in self.data
+        ]
+        # _process_one converts failures to result dicts, so no task raises
+        for completed in asyncio.as_completed(tasks):
+            yield await completed
+
+    async def process_all_accounts(self) -> List[Dict[str, Any]]:
+        """
+        Process all accounts for this game concurrently
+
+        Returns:
+            List of result dicts for each account (in completion order)
+        """
+        return [result async for result in self.stream_all_accounts()]
+
+    async def send_discord_notification_direct(self, guild_id, success_data):
+        """
+        Send Discord notification to configured channel
+
+        Args:
+            guild_id: Discord guild ID
+            success_data: Dict with check-in results
+        """
+        try:
+            channel = await resolve_checkin_channel(guild_id)
+            if not channel:
+                return
+
+            await self.send_notification(channel, success_data)
+
+        except Exception as e:
+            logger.error("Error sending Discord notification: %s", e)
+
+    async def send_notification(self, channel, success_data):
+        """Send a check-in notification to an already-resolved channel"""
+        try:
+            # Build embed payload, materialized only for the send
+            embed = discord.Embed.from_dict(self._build_notification_embed(success_data))
+
+            # Send message
+            await _channel_limiter(channel.id).acquire()
+            await channel.send(embed=embed)
+            logger.info("Sent Endfield notification to channel %s", channel.id)
+
+        except Exception as e:
+            logger.error("Error sending Discord notification: %s", e)
+
+    async def send_batch_notification(self, channel, results):
+        """
+        Send check-in notifications for a batch of accounts
+
+        Embeds are grouped 10 per message (Discord's limit), so K accounts
+        cost ceil(K/10) REST calls instead of K.
+        """
+        try:
+            payloads = [self._build_notification_embed(result) for result in results]
+            limiter = _channel_limiter(channel.id)
+            for start in range(0, len(payloads), 10):
+                await limiter.acquire()
+                await channel.send(embeds=[
+                    discord.Embed.from_dict(payload)
+                    for payload in payloads[start:start + 10]
+                ])
+            logger.info("Sent %d Endfield notifications to channel %s", len(payloads), channel.id)
+
+        except Exception as e:
+            logger.error("Error sending Discord notifications: %s", e)
+
+    def _build_notification_embed(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the embed payload (raw dict) for a check-in notification
+
+        Returning Discord's embed JSON shape directly keeps this a pure
+        function over the result row: the static footer/thumbnail pieces
+        from __init__ are shared by reference, and discord.Embed is only
+        materialized at the channel.send call site via Embed.from_dict.
+        """
+        account_name = data.get("account_name", "Doctor")
+
+        embed = {
+            "title": "📋 Daily Check-in Report",
+            "description": data["message"],
+            "color": self._color_success if data["success"] else self._color_failure,
+            "author": {
+                "name": f"{self._author_name} • {account_name}",
+                "icon_url": self._icon_url
+            },
+            "footer": self._embed_footer
+        }
+
+        # Add fields
+        reward = None
+        reward_icon = None
+        if data["success"] or data.get("already_signed"):
+            # Show total sign days
+            total_days = data.get("total_sign_day", 0)
+            fields = [{
+                "name": "📅 Total Sign-ins",
+                "value": f"{total_days} days",
+                "inline": True
+            }]
+
+            # Show reward if available
+            reward = data.get("reward")
+            if reward:
+                reward_icon = reward.get('icon', '')
+                fields.append({
+                    "name": "🎁 Reward",
+                    "value": f"{reward.get('name', 'Unknown')} x{reward.get('count', 0)}",
+                    "inline": True
+                })
+
+            # Show additional rewards if available
+            all_rewards = data.get("all_rewards", [])
+            if all_rewards and len(all_rewards) > 1:
+                bonus_rewards = [f"{r.get('name', 'Unknown')} x{r.get('count', 0)}"
+                                for r in all_rewards[1:]]  # Skip first (main reward)
+                if bonus_rewards:
+                    fields.append({
+                        "name": "🌟 Bonus Rewards",
+                        "value": "\n".join(bonus_rewards),
+                        "inline": False
+                    })
+
+            embed["fields"] = fields
+
+        # Set reward icon on the right side (thumbnail) if available,
+        # falling back to the shared game-icon reference
+        if reward and reward_icon:
+            embed["thumbnail"] = {"url": reward_icon}
+        elif self._embed_thumbnail:
+            embed["thumbnail"] = self._embed_thumbnail
+
+        return embed
+
+
+class GameManager:
+    """Manages check-in processing for all games"""
+
+    # How many guilds may process check-ins at the same time. Guilds share
+    # no state, so only the HTTP pool bounds useful parallelism here.
+    GUILD_CONCURRENCY = 8
+
+    def __init__(self):
+        self.constants = constants
+
+    async def process_game_checkins(self, guild_id, game_name, game_config, accounts):
+        """
+        Process check-ins for a specific game
+
+        Args:
+            guild_id: Discord guild ID
+            game_name: Name of the game (e.g., "endfield")
+            game_config: Game configuration dict
+            accounts: List of account dicts with 'name' and 'cookie'
+
+        Returns:
+            List of successful check-in results
+        """
+        logger.info("Processing %d accounts for %s", len(accounts), game_config['game'])
+
+        # Create game instance
+        game = Game(game_name, game_config, accounts)
+
+        # Stream results as they complete: NEW check-ins (not already signed)
+        # are batched into notifications that go out while slower accounts
+        # are still signing in, pipelining the two stages
+        all_success = []
+        pending = []
+        channel = None
+        channel_resolved = False
+
+        async for result in game.stream_all_accounts():
+            if result["success"] or result.get("already_signed"):
+                all_success.append(result)
+            if not result["success"] or result.get("already_signed"):
+                continue
+
+            # Resolve the notification channel once, on the first new check-in
+            if not channel_resolved:
+                channel = await resolve_checkin_channel(guild_id)
+                channel_resolved = True
+            if channel:
+                pending.append(result)
+                if len(pending) >= 10:
+                    await game.send_batch_notification(channel, pending)
+                    pending = []
+
+        if channel and pending:
+            await game.send_batch_notification(channel, pending)
+
+        # Return all successful results (including already signed)
+        return all_success
+
+    async def process_all_guilds(self, jobs):
+        """
+        Process check-in jobs for many guilds concurrently
+
+        Guilds were previously processed one after another even though they
+        share no state; with the pooled HTTP session and per-channel rate
+        limiting in place, they can safely fan out (bounded by
+        GUILD_CONCURRENCY).
+
+        Args:
+            jobs: List of (guild_id, game_name, game_config, accounts) tuples
+
+        Returns:
+            List of per-job success lists, in job order. A job that raises
+            is logged and contributes an empty list.
+        """
+        semaphore = asyncio.Semaphore(self.GUILD_CONCURRENCY)
+
+        async def run_one(job):
+            guild_id, game_name, game_config, accounts = job
+            async with semaphore:
+                try:
+                    return await self.process_game_checkins(
+                        guild_id, game_name, game_config, accounts
+                    )
+                except Exception as e:
+                    logger.error("Check-ins failed for %s in guild %s: %s",
+                                 game_name, guild_id, e)
+                    return []
+
+        return await asyncio.gather(*(run_one(job) for job in jobs))
+
+
+# Shared manager instance: GameManager holds no per-run state, so callers
+# reuse one instead of constructing a new manager per invocation
+_game_manager = None
+
+def get_game_manager() -> GameManager:
+    """Get the module-level GameManager singleton (lazily created)"""
+    global _game_manager
+    if _game_manager is None:
+        _game_manager = GameManager()
+    return _game_manager
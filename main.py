@@ -4,7 +4,7 @@ import io
 import asyncio
 import logging
 from utils.database import fetch_cookies_from_database
-from games.game import GameManager
+from games.game import get_game_manager
 from utils.logger import setup_logging
 from database.connection import init_database, db_manager
 from database.operations import db_ops
@@ -38,15 +38,17 @@ async def check_in_all_games():
             logging.error("No guilds with accounts found in database. Exiting...")
             return
 
-        # Initialize game manager
-        game_manager = GameManager()
-        total_successes = 0
+        # Shared game manager
+        game_manager = get_game_manager()
 
-        # Process each guild separately
+        # Collect one job per (guild, game); guilds share no state, so the
+        # manager fans them out concurrently instead of one after another
+        jobs = []
+        job_labels = []
         for guild in guilds_with_accounts:
             guild_id = guild.id
             guild_name = guild.name
-            logging.info(f"======== Processing Guild: {guild_name} ({guild_id}) ========")
+            logging.info(f"======== Collecting accounts for Guild: {guild_name} ({guild_id}) ========")
 
             # Fetch cookies for this guild
             cookies = await fetch_cookies_from_database(guild_id)
@@ -54,25 +56,24 @@ async def check_in_all_games():
                 logging.warning(f"No account cookies for guild {guild_name}")
                 continue
 
-            # Process each game for this guild
             for game_name, accounts in cookies.items():
                 if accounts:
-                    logging.info(f"--------- Processing {game_name} for {guild_name} ---------")
-
                     # Get game configuration from database
                     game_config = await db_ops.get_game_config(game_name)
                     if not game_config:
                         logging.error(f"No configuration found for game: {game_name}")
                         continue
 
-                    try:
-                        successes = await game_manager.process_game_checkins(
-                            guild_id, game_name, game_config, accounts
-                        )
-                        total_successes += len(successes)
-                        logging.info(f"{len(successes)} successful check-ins for {game_config['game']} in {guild_name}")
-                    except Exception as e:
-                        logging.error(f"Error during check-ins for {game_config['game']} in {guild_name}: {e}")
+                    jobs.append((guild_id, game_name, game_config, accounts))
+                    job_labels.append((game_config['game'], guild_name))
+
+        # Process all guilds in parallel (bounded inside the manager)
+        results = await game_manager.process_all_guilds(jobs)
+
+        total_successes = 0
+        for (game_title, guild_name), successes in zip(job_labels, results):
+            total_successes += len(successes)
+            logging.info(f"{len(successes)} successful check-ins for {game_title} in {guild_name}")
 
         end_time = asyncio.get_event_loop().time()
         logging.info("----------------------------------------")
@@ -83,7 +84,9 @@ async def check_in_all_games():
     except Exception as e:
         logging.error(f"Fatal error in check-in process: {e}")
     finally:
-        # Clean up database connections
+        # Clean up HTTP and database connections
+        from games.endfield_adapter import close_shared_session
+        await close_shared_session()
         await db_manager.close()
 
 
@@ -1,21 +1,56 @@
+import asyncio
 import logging
+import time
+
+# Cache for fetch_all_games: the game list changes almost never, but
+# autocomplete hits this on every keystroke. (timestamp, value) guarded
+# by a lock so concurrent misses don't stampede the database.
+_GAMES_CACHE_TTL = 300  # seconds
+_games_cache = None  # (monotonic timestamp, list of game names)
+_games_cache_lock = asyncio.Lock()
+
+def invalidate_games_cache():
+    """Drop the cached game list (call after adding/removing games)"""
+    global _games_cache
+    _games_cache = None
 
 async def fetch_all_games():
-    """Fetch all games from database"""
+    """Fetch all games from database (cached with a short TTL)"""
+    global _games_cache
+    if _games_cache and time.monotonic() - _games_cache[0] < _GAMES_CACHE_TTL:
+        return _games_cache[1]
+
+    async with _games_cache_lock:
+        # Re-check after acquiring the lock - another task may have refreshed
+        if _games_cache and time.monotonic() - _games_cache[0] < _GAMES_CACHE_TTL:
+            return _games_cache[1]
+
+        try:
+            from database.connection import db_manager
+            from database.models import Game
+            from sqlalchemy import select
+
+            async with db_manager.get_session() as session:
+                stmt = select(Game).where(Game.is_active == True)
+                result = await session.execute(stmt)
+                games = result.scalars().all()
+                names = [game.name for game in games]
+        except Exception as e:
+            logging.error(f"[DATABASE] fetch_all_games failed: {e}")
+            # Fallback to endfield for arknights bot
+            return ["endfield"]
+
+        _games_cache = (time.monotonic(), names)
+        return names
+
+async def get_guild_accounts_by_game(guild_id):
+    """Get all active accounts in a guild grouped by game (single query)"""
+    from database.operations import db_ops
     try:
-        from database.connection import db_manager
-        from database.models import Game
-        from sqlalchemy import select
-        
-        async with db_manager.get_session() as session:
-            stmt = select(Game).where(Game.is_active == True)
-            result = await session.execute(stmt)
-            games = result.scalars().all()
-            return [game.name for game in games]
+        return await db_ops.get_all_accounts_by_game(guild_id)
     except Exception as e:
-        logging.error(f"[DATABASE] fetch_all_games failed: {e}")
-        # Fallback to endfield for arknights bot
-        return ["endfield"]
+        logging.error(f"[DATABASE] get_guild_accounts_by_game failed: {e}")
+        return {}
 
 async def get_guild_accounts(guild_id, game):
     from database.operations import db_ops
@@ -81,6 +116,7 @@ async def fetch_cookies_from_database(guild_id: int):
             cookies[game_name] = []
             for account in accounts:
                 cookies[game_name].append({
+                    'id': account.id,
                     'name': account.name,
                     'cookie': account.decrypted_cookie
                 })